@@ -1,7 +1,34 @@
+import logging
 import os
-import sys
+import stat
+import time
+import weakref
 
-from cfgengine.parser import ParserRegistry
+from cfgengine.parser import DotDict, ParserRegistry
+
+_logger = logging.getLogger(__name__)
+
+# Cache of check_file_path results keyed by path. Each entry is
+# (is_file, checked_at); entries older than _STAT_CACHE_TTL are re-checked.
+_stat_cache = {}
+_STAT_CACHE_TTL = 1.0
+
+# Expand the user config directory once; set_default_file_name only needs a
+# path join afterwards instead of re-running expanduser.
+_HOME_CONFIG_DIR = os.path.expanduser("~/.config")
+
+
+class _DefaultEnvKey:
+    """Weak-referenceable stand-in cache key for jinja2_env=None."""
+
+
+_DEFAULT_ENV_TOKEN = _DefaultEnvKey()
+
+# Parsed configs per Jinja environment, {path: ((mtime_ns, size), parsed)}.
+# Keyed weakly on the environment (same pattern as the template caches in
+# cfgengine.parser) so discarding an environment drops its entries and a
+# recycled id() can never alias a new environment to stale results.
+_config_caches = weakref.WeakKeyDictionary()
 
 
 class ConfigLoader:
@@ -12,7 +39,7 @@ class ConfigLoader:
 
     DEFAULT_CONFIG_FILE_VAR = "CFGENGINE_CONF"
     DEFAULT_CONFIG_FILE_NAME = "config_engine.json"
-    DEFAULT_HOME_PATH = os.path.expanduser(f"~/.config/{DEFAULT_CONFIG_FILE_NAME}")
+    DEFAULT_HOME_PATH = os.path.join(_HOME_CONFIG_DIR, DEFAULT_CONFIG_FILE_NAME)
     DEFAULT_CURRENT_PATH = f"./{DEFAULT_CONFIG_FILE_NAME}"
 
     @classmethod
@@ -24,7 +51,7 @@ class ConfigLoader:
             file_name (str): New default configuration file name.
         """
         cls.DEFAULT_CONFIG_FILE_NAME = file_name
-        cls.DEFAULT_HOME_PATH = os.path.expanduser(f"~/.config/{file_name}")
+        cls.DEFAULT_HOME_PATH = os.path.join(_HOME_CONFIG_DIR, file_name)
         cls.DEFAULT_CURRENT_PATH = f"./{file_name}"
 
     @staticmethod
@@ -32,13 +59,43 @@ class ConfigLoader:
         """
         Validate if the provided path exists and is a file.
 
+        Results are cached for a short TTL so repeated lookups (reloaders,
+        test suites) do not re-issue a stat syscall per call.
+
         Parameters:
             path (str): The file path to check.
 
         Returns:
             bool: True if the path exists and is a file, False otherwise.
         """
-        return os.path.isfile(path) if path else False
+        if not path:
+            return False
+        now = time.monotonic()
+        hit = _stat_cache.get(path)
+        if hit is not None and now - hit[1] < _STAT_CACHE_TTL:
+            return hit[0]
+        # One os.stat and a mode check; os.path.isfile does the same but adds
+        # an extra layer of function dispatch.
+        try:
+            is_file = stat.S_ISREG(os.stat(path).st_mode)
+        except (OSError, ValueError):
+            is_file = False
+        _stat_cache[path] = (is_file, now)
+        return is_file
+
+    @staticmethod
+    def invalidate_stat_cache(path=None):
+        """
+        Drop cached check_file_path results.
+
+        Parameters:
+            path (str, optional): Invalidate only this path; clear everything
+            when omitted.
+        """
+        if path is None:
+            _stat_cache.clear()
+        else:
+            _stat_cache.pop(path, None)
 
     @classmethod
     def get_config_file_path(cls, config_dir_or_path=None):
@@ -57,29 +114,23 @@ class ConfigLoader:
         if config_dir_or_path:
             # Check if it's a full path to a file
             if cls.check_file_path(config_dir_or_path):
-                sys.stdout.write(
-                    f"[INFO] Using configuration file: {config_dir_or_path}\n"
-                )
+                _logger.info("Using configuration file: %s", config_dir_or_path)
                 return config_dir_or_path
 
             # Treat as a directory and append the default file name
             custom_path = os.path.join(config_dir_or_path, cls.DEFAULT_CONFIG_FILE_NAME)
             if cls.check_file_path(custom_path):
-                sys.stdout.write(f"[INFO] Using configuration file: {custom_path}\n")
+                _logger.info("Using configuration file: %s", custom_path)
                 return custom_path
 
             raise FileNotFoundError(f"Specified path is invalid: {config_dir_or_path}")
 
-        # Default search paths
-        paths = [
-            cls.DEFAULT_CURRENT_PATH,
-            os.environ.get(cls.DEFAULT_CONFIG_FILE_VAR),
-            cls.DEFAULT_HOME_PATH,
-        ]
-
-        for path in paths:
-            if cls.check_file_path(path):
-                sys.stdout.write(f"[INFO] Using configuration file: {path}\n")
+        # Default search paths; the env var may be unset, so skip None before
+        # paying for a file check.
+        env_path = os.environ.get(cls.DEFAULT_CONFIG_FILE_VAR)
+        for path in (cls.DEFAULT_CURRENT_PATH, env_path, cls.DEFAULT_HOME_PATH):
+            if path and cls.check_file_path(path):
+                _logger.info("Using configuration file: %s", path)
                 return path
 
         raise FileNotFoundError(
@@ -88,7 +139,7 @@ class ConfigLoader:
             f"    1. Specified path or directory: {config_dir_or_path or 'Not provided'}\n"
             f"    2. Current directory: {cls.DEFAULT_CURRENT_PATH}\n"
             f"    3. Environment variable {cls.DEFAULT_CONFIG_FILE_VAR}: "
-            f"{os.environ.get(cls.DEFAULT_CONFIG_FILE_VAR) or 'Not set'}\n"
+            f"{env_path or 'Not set'}\n"
             f"    4. User home directory: {cls.DEFAULT_HOME_PATH}\n"
         )
 
@@ -111,6 +162,21 @@ class ConfigLoader:
             ValueError: If no parser is registered for the file extension.
         """
         config_path = cls.get_config_file_path(config_dir_or_path)
+        # A matching stat means the file is unchanged and the previous parse
+        # can be reused without re-reading or re-rendering.
+        stat_result = os.stat(config_path)
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        env_key = jinja2_env if jinja2_env is not None else _DEFAULT_ENV_TOKEN
+        cache = _config_caches.get(env_key)
+        if cache is None:
+            cache = _config_caches[env_key] = {}
+        cached = cache.get(config_path)
+        if cached is not None and cached[0] == cache_key:
+            # Top-level copy so one caller's mutations never reach the cache
+            # or other callers; nested containers are still shared.
+            return DotDict(cached[1])
+
         _, ext = os.path.splitext(config_path)
         ext = ext.lstrip(".")
 
@@ -121,4 +187,21 @@ class ConfigLoader:
 
         parser = parser_class(config_path)
         ret = parser.parse(jinja2_env) if jinja2_env else parser.parse()
-        return ret
+        cache[config_path] = (cache_key, ret)
+        return DotDict(ret)
+
+    @classmethod
+    def clear_config_cache(cls, path=None):
+        """
+        Drop cached parsed configurations.
+
+        Parameters:
+            path (str, optional): Invalidate only this path; clear everything
+            when omitted.
+        """
+        if path is None:
+            for cache in _config_caches.values():
+                cache.clear()
+        else:
+            for cache in _config_caches.values():
+                cache.pop(path, None)
@@ -1,22 +1,61 @@
+import configparser
+import json
 import logging
+import sys
 
 from cfgengine.parser import CfgParser, register_cfg_parser
 
+try:
+    # Optional accelerator: orjson parses JSON several times faster than the
+    # stdlib. Fall back silently when it is not installed.
+    import orjson
+except ImportError:
+    orjson = None
+
 _logger = logging.getLogger(__name__)
 
 
+def _interned_object_pairs(pairs):
+    """Build a JSON object dict with interned keys (for repeated key names)."""
+    return {sys.intern(key): value for key, value in pairs}
+
+
 @register_cfg_parser("json")
 class JSONParser(CfgParser):
-    """Parser for JSON configuration files."""
+    """
+    Parser for JSON configuration files.
 
-    def load(self):
-        import json
+    An optional schema (an iterable of top-level key names) restricts the
+    loaded document to just those sections, so template scanning and DotDict
+    conversion never touch config the application does not read.
+    """
+
+    __slots__ = ("schema",)
+
+    def __init__(self, file_path, schema=None):
+        super().__init__(file_path)
+        self.schema = frozenset(schema) if schema is not None else None
 
+    @staticmethod
+    def loads(data):
+        """
+        Parse a JSON document already held in memory (bytes or str), e.g. a
+        ConfigMap payload, without touching the filesystem.
+        """
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data, object_pairs_hook=_interned_object_pairs)
+
+    def load(self):
         _logger.info(f"Loading JSON configuration from {self.file_path}")
         try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            mode = "rb" if orjson is not None else "r"
+            with open(self.file_path, mode) as f:
+                data = self.loads(f.read())
+            if self.schema is not None and isinstance(data, dict):
+                return {key: value for key, value in data.items() if key in self.schema}
+            return data
+        except ValueError as e:
             _logger.error(f"Failed to parse JSON configuration: {e}")
             raise ValueError(f"Invalid JSON configuration in {self.file_path}") from e
         except FileNotFoundError:
@@ -28,18 +67,39 @@ class JSONParser(CfgParser):
 
 
 @register_cfg_parser("ini")
-@register_cfg_parser("INI")
 class INIParser(CfgParser):
     """Parser for INI configuration files."""
 
-    def load(self):
-        import configparser
+    __slots__ = ()
 
+    @staticmethod
+    def _sections_to_dict(config):
+        # Intern section and key names: the same names recur across files,
+        # so downstream dict lookups compare interned strings by identity.
+        return {
+            sys.intern(section): {
+                sys.intern(key): value for key, value in config[section].items()
+            }
+            for section in config.sections()
+        }
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Parse an INI document already held in memory (str) without touching
+        the filesystem.
+        """
+        config = configparser.ConfigParser()
+        config.read_string(data)
+        return cls._sections_to_dict(config)
+
+    def load(self):
         _logger.info(f"Loading INI configuration from {self.file_path}")
         try:
             config = configparser.ConfigParser()
-            config.read(self.file_path)
-            return {section: dict(config[section]) for section in config.sections()}
+            with open(self.file_path, "r", encoding="utf-8", buffering=65536) as f:
+                config.read_file(f)
+            return self._sections_to_dict(config)
         except configparser.Error as e:
             _logger.error(f"Failed to parse INI configuration: {e}")
             raise ValueError(f"Invalid INI configuration in {self.file_path}") from e
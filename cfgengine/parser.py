@@ -1,14 +1,126 @@
+import ast
+import functools
 import importlib
 import os
+import sys
 import warnings
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
 
-from jinja2 import UndefinedError, nodes
-from jinja2.nativetypes import NativeEnvironment
 
-# Default Jinja2 NativeEnvironment
-_default_env = NativeEnvironment()
+@functools.lru_cache(maxsize=None)
+def _get_default_env():
+    """
+    Create the default Jinja2 NativeEnvironment on first use.
+
+    Building the environment (and importing jinja2 at all) is deferred so that
+    `import cfgengine` stays cheap for users who never render templates.
+    """
+    from jinja2.nativetypes import NativeEnvironment
+
+    env = NativeEnvironment()
+    env.globals["import_py_obj"] = import_py_obj
+    env.globals["env_var"] = env_var
+    return env
+
+
+# Compiled-template caches per Jinja environment ({source: Template}). Keyed
+# weakly so discarding an environment also drops its templates; Parser
+# instances are short-lived, so sharing the cache here lets repeated loads
+# reuse earlier compilations.
+_env_template_caches = weakref.WeakKeyDictionary()
+
+# Function-call extraction results per environment ({source: calls}), managed
+# the same way as the compiled-template caches.
+_env_call_caches = weakref.WeakKeyDictionary()
+
+
+def _get_template_cache(env):
+    """Return the shared compiled-template cache for a Jinja environment."""
+    cache = _env_template_caches.get(env)
+    if cache is None:
+        cache = _env_template_caches[env] = {}
+    return cache
+
+
+# Jinja2 delimiters that mark a string as a template.
+_TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+def _is_template_string(value):
+    """Return True if the string contains Jinja2 template markers."""
+    # One '{' scan rejects the vast majority of plain strings before the
+    # three two-character marker scans run.
+    if "{" not in value:
+        return False
+    return any(marker in value for marker in _TEMPLATE_MARKERS)
+
+
+def _native_literal(value):
+    """
+    Coerce a string to a native Python literal the same way jinja2's
+    native_concat does ("8080" -> 8080, "None" -> None), returning the
+    string unchanged when it is not a literal.
+    """
+    try:
+        return ast.literal_eval(ast.parse(value, mode="eval"))
+    except (ValueError, SyntaxError, MemoryError):
+        return value
+
+
+def _coerce_native(config):
+    """
+    Apply _native_literal to every string leaf of the configuration, in
+    place. Used on the template-free fast path so skipping Jinja yields the
+    same values a NativeEnvironment render would have produced.
+    """
+    stack = [config]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for key, value in container.items():
+                if isinstance(value, str):
+                    coerced = _native_literal(value)
+                    if coerced is not value:
+                        container[key] = coerced
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            for i, value in enumerate(container):
+                if isinstance(value, str):
+                    coerced = _native_literal(value)
+                    if coerced is not value:
+                        container[i] = coerced
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+    return config
+
+
+# Types the parser may need to transform; a list holding none of these (e.g.
+# a large numeric array) can be shared as-is without copying or walking it.
+# isinstance keeps subclasses (OrderedDict, third-party mapping types from
+# YAML parsers) visible to the walkers.
+_PARSEABLE_TYPES = (str, dict, list)
+
+
+def _list_needs_parse(lst):
+    """Return True if a list contains any member the parser could transform."""
+    return any(isinstance(item, _PARSEABLE_TYPES) for item in lst)
+
+
+def _contains_templates(config):
+    """Return True if any string in the configuration tree is a template."""
+    stack = [config]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if _is_template_string(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
 
 
 def custom_warning_format(message, category, filename, lineno, line=None):
@@ -23,23 +135,47 @@ class CfgParser(ABC):
     Abstract base class for configuration parsers.
     """
 
+    __slots__ = ("file_path",)
+
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def parse(self, jinja_env=_default_env):
+    def parse(self, jinja_env=None):
         """
         Parse the configuration file and return the data as a DotDict.
         If the provided Jinja environment is not a NativeEnvironment, issue a warning.
         """
-        if not issubclass(jinja_env.__class__, NativeEnvironment):
+        cfg = self.load()
+
+        # Template-free configs never need Jinja; skip importing jinja2 and
+        # building an environment altogether. Rendering through a
+        # NativeEnvironment coerces plain scalars ("8080" -> 8080), so the
+        # fast path must apply the same coercion to stay behavior-identical.
+        if not _contains_templates(cfg):
+            if jinja_env is None:
+                native = True
+            else:
+                from jinja2.nativetypes import NativeEnvironment
+
+                native = issubclass(jinja_env.__class__, NativeEnvironment)
+            if native:
+                _coerce_native(cfg)
+            return DotDict(cfg)
+
+        from jinja2.nativetypes import NativeEnvironment
+
+        if jinja_env is None:
+            jinja_env = _get_default_env()
+        elif not issubclass(jinja_env.__class__, NativeEnvironment):
             warnings.warn(
                 "The provided Jinja environment is not NativeEnvironment. "
                 "This may result in rendering output as strings only. "
                 "If you need native Python objects, consider using NativeEnvironment.",
                 UserWarning,
             )
-        cfg = self.load()
-        ret = Parser(jinja_env).parse_config(cfg)
+        parser = Parser(jinja_env)
+        parser.precompile(cfg)
+        ret = parser.parse_config(cfg)
         return DotDict(ret)
 
     @abstractmethod
@@ -60,14 +196,16 @@ class ParserRegistry:
 
     @classmethod
     def register_parser(cls, extension, parser_clz):
-        """Register a parser for a specific file extension."""
-        cls._parsers[extension] = parser_clz
+        """Register a parser for a specific file extension (case-insensitive)."""
+        # Interned keys make later lookups hit identity comparison instead of
+        # character-by-character string equality.
+        cls._parsers[sys.intern(extension.lower())] = parser_clz
 
     @classmethod
     def get_parser_class(cls, extension):
         """Retrieve the parser class associated with a file extension."""
-        parser_class = cls._parsers.get(extension)
-        if not parser_class:
+        parser_class = cls._parsers.get(extension.lower())
+        if parser_class is None:
             raise ValueError(f"No parser registered for extension: {extension}")
         return parser_class
 
@@ -83,13 +221,86 @@ class ParserError(Exception):
 class DotDict(dict):
     """
     A dictionary that allows attribute-style access.
+
+    Keys are mirrored into the instance ``__dict__`` so attribute reads
+    resolve through CPython's C-level lookup instead of the Python-level
+    ``__getattr__`` hook, which only remains as a fallback for keys the
+    mirror cannot hold (non-identifier or method-shadowing names).
     """
 
     def __init__(self, dictionary):
-        super().__init__(dictionary)
-        for key, value in self.items():
+        # An existing DotDict already has its nested values wrapped; a plain
+        # bulk copy is enough and skips the per-item walk below.
+        if type(dictionary) is DotDict:
+            dict.__init__(self, dictionary)
+            self.__dict__.update(dictionary.__dict__)
+            return
+        # Build directly from the source mapping in a single pass instead of
+        # copying everything first and then re-walking to wrap nested dicts.
+        dict.__init__(self)
+        for key, value in dictionary.items():
+            # isinstance rather than an exact-type check: dict subclasses
+            # (OrderedDict, third-party mappings) must be wrapped too. Already
+            # wrapped DotDicts are left alone.
             if isinstance(value, dict):
-                self[key] = DotDict(value)
+                if type(value) is not DotDict:
+                    value = DotDict(value)
+            elif isinstance(value, list):
+                value = self._wrap_list(value)
+            self[key] = value
+
+    @staticmethod
+    def _wrap_list(lst):
+        """Wrap dicts nested inside lists (recursively) as DotDict."""
+        return [
+            DotDict(item)
+            if isinstance(item, dict) and type(item) is not DotDict
+            else (DotDict._wrap_list(item) if isinstance(item, list) else item)
+            for item in lst
+        ]
+
+    def _mirror(self, key, value):
+        """Expose a key as an instance attribute unless it would shadow dict API."""
+        if type(key) is str and key not in _DOTDICT_RESERVED:
+            self.__dict__[key] = value
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._mirror(key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.__dict__.pop(key, None)
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        for key, value in self.items():
+            self._mirror(key, value)
+
+    def __ior__(self, other):
+        result = dict.__ior__(self, other)
+        for key, value in self.items():
+            self._mirror(key, value)
+        return result
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+            return default
+        return self[key]
+
+    def pop(self, key, *default):
+        self.__dict__.pop(key, None)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.__dict__.pop(key, None)
+        return key, value
+
+    def clear(self):
+        dict.clear(self)
+        self.__dict__.clear()
 
     def __getattr__(self, name):
         if name in self:
@@ -106,35 +317,60 @@ class DotDict(dict):
             raise AttributeError(f"DotDict object has no attribute '{name}'")
 
 
+# Attribute names that must keep resolving to the dict API rather than to a
+# mirrored key; reads of such keys fall back to __getattr__.
+_DOTDICT_RESERVED = frozenset(dir(DotDict))
+
+
 class FunctionCallExtractor:
     """
     Extracts function calls from Jinja2 templates.
     """
 
+    __slots__ = ("env", "_cache", "_known")
+
     def __init__(self, env):
         self.env = env
+        # Extraction results per template source, shared per environment so a
+        # template string is lexed and walked only once.
+        cache = _env_call_caches.get(env)
+        if cache is None:
+            cache = _env_call_caches[env] = {}
+        self._cache = cache
+        # Snapshot of the global function names as a compact frozenset; the
+        # per-node membership test below avoids probing the full globals dict.
+        self._known = frozenset(env.globals)
 
     def extract(self, template_str):
         """
         Parse a template string and extract all function calls defined in the Jinja
         environment.
         """
+        cached = self._cache.get(template_str)
+        if cached is not None:
+            return cached
+
+        from jinja2 import nodes
+
         ast = self.env.parse(template_str)
-        calls = defaultdict(list)
-
-        def visit_node(node):
-            if isinstance(node, nodes.Call):
-                if (
-                    isinstance(node.node, nodes.Name)
-                    and node.node.name in self.env.globals
-                ):
-                    func_name = node.node.name
-                    # args = [arg.as_const() for arg in node.args]
-                    calls[func_name].append(func_name)
-            for child in node.iter_child_nodes():
-                visit_node(child)
-
-        visit_node(ast)
+        calls = {}
+        globals_ = self._known
+
+        # Walk iteratively with an explicit stack: no per-node Python frame
+        # and no RecursionError on deeply nested expressions.
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            if (
+                isinstance(node, nodes.Call)
+                and isinstance(node.node, nodes.Name)
+                and node.node.name in globals_
+            ):
+                func_name = node.node.name
+                calls.setdefault(func_name, []).append(func_name)
+            stack.extend(node.iter_child_nodes())
+
+        self._cache[template_str] = calls
         return calls
 
 
@@ -143,78 +379,195 @@ class Parser:
     Responsible for parsing configuration data using Jinja2 templates.
     """
 
-    def __init__(self, env):
+    __slots__ = ("env", "call_extractor", "_template_cache", "_dispatch", "_native")
+
+    def __init__(self, env=None):
+        from jinja2.nativetypes import NativeEnvironment
+
+        if env is None:
+            env = _get_default_env()
         self.env = env
+        # Native environments coerce rendered scalars to Python literals; the
+        # marker-free fast path in parse_string must do the same.
+        self._native = isinstance(env, NativeEnvironment)
         self.call_extractor = FunctionCallExtractor(env)
+        # Compiled templates keyed by template source, shared per environment
+        # so the compile cost is amortized across parses as well as across
+        # duplicate strings within one config.
+        self._template_cache = _get_template_cache(env)
+        # Exact-type dispatch table; a single dict lookup replaces the
+        # isinstance chain in parse_value.
+        self._dispatch = {
+            str: self.parse_string,
+            list: self.parse_list,
+            dict: self._parse_dict,
+        }
+
+    def precompile(self, config):
+        """
+        Walk the whole configuration once and compile every unique template
+        string up front, so duplicated templates are compiled a single time
+        regardless of how often they occur.
+        """
+        stack = [(config, "")]
+        while stack:
+            value, key = stack.pop()
+            if isinstance(value, str):
+                if value not in self._template_cache and _is_template_string(value):
+                    self._compile_template(value, key)
+            elif isinstance(value, dict):
+                stack.extend((v, k) for k, v in value.items())
+            elif isinstance(value, list):
+                stack.extend(
+                    (item, f"{key}[{i}]") for i, item in enumerate(value)
+                )
 
     def parse_config(self, config):
-        """Parse a configuration dictionary."""
-        parsed_config = {}
-        for key, value in config.items():
-            parsed_config[key] = self.parse_value(value, key)
-        return parsed_config
+        """
+        Parse a configuration dictionary in place and return it.
+
+        The tree is walked with an explicit worklist instead of recursion, so
+        arbitrarily deep configs cost no Python frames per level. Containers
+        are mutated directly rather than copied; only string leaves that
+        actually render to something new are written back.
+        """
+        stack = [(config, "")]
+        while stack:
+            container, path = stack.pop()
+            if isinstance(container, dict):
+                for key, value in container.items():
+                    if isinstance(value, str):
+                        parsed_value = self.parse_string(value, key)
+                        if parsed_value is not value:
+                            container[key] = parsed_value
+                    elif isinstance(value, dict):
+                        stack.append((value, key))
+                    elif isinstance(value, list) and _list_needs_parse(value):
+                        stack.append((value, key))
+            else:
+                for i, value in enumerate(container):
+                    if isinstance(value, str):
+                        item_key = f"{path}[{i}]"
+                        parsed_value = self.parse_string(value, item_key)
+                        if parsed_value is not value:
+                            container[i] = parsed_value
+                    elif isinstance(value, dict):
+                        stack.append((value, f"{path}[{i}]"))
+                    elif isinstance(value, list) and _list_needs_parse(value):
+                        stack.append((value, f"{path}[{i}]"))
+        return config
 
     def parse_value(self, value, key):
         """Recursively parse values in the configuration."""
-        if isinstance(value, str):
-            return self.parse_string(value, key)
-        elif isinstance(value, list):
-            return self.parse_list(value, key)
-        elif isinstance(value, dict):
-            return self.parse_config(value)
-        else:
-            return value
+        handler = self._dispatch.get(type(value))
+        if handler is None:
+            # Subclasses miss the exact-type table; fall back to isinstance
+            # so OrderedDict and friends are still parsed.
+            if isinstance(value, str):
+                handler = self.parse_string
+            elif isinstance(value, dict):
+                handler = self._parse_dict
+            elif isinstance(value, list):
+                handler = self.parse_list
+        return handler(value, key) if handler else value
+
+    def _parse_dict(self, value, key):
+        """Dispatch helper: parse a nested dict (the key is not used)."""
+        return self.parse_config(value)
 
     def parse_string(self, value, key):
         """
         Parse a string value as a Jinja2 template.
         Raises a ParserError if multiple non-string-returning functions are detected.
         """
-        try:
-            function_calls = self.call_extractor.extract(value)
-            non_string_functions = [
-                func
-                for func in function_calls
-                if getattr(self.env.globals.get(func), "returns_native", False)
-            ]
-
-            if len(non_string_functions) > 1:
-                raise ParserError(
-                    f"Template error for key '{key}': Multiple non-string-returning"
-                    f"functions cannot be used together in the same template. Found: "
-                    f"{', '.join(non_string_functions)}"
-                )
+        # Plain strings need no Jinja pass at all; a substring scan is far
+        # cheaper than lexing, compiling and rendering the value. Native
+        # environments would still have coerced the rendered scalar, so the
+        # shortcut must coerce too.
+        if not _is_template_string(value):
+            return _native_literal(value) if self._native else value
+
+        from jinja2 import UndefinedError
 
-            return self.env.from_string(value).render()
+        try:
+            template = self._template_cache.get(value)
+            if template is None:
+                template = self._compile_template(value, key)
+            return template.render()
         except UndefinedError as e:
             raise ValueError(f"Error rendering template for key '{key}': {e}")
 
+    def _compile_template(self, value, key):
+        """
+        Validate and compile a template string, caching the compiled Template.
+        Raises a ParserError if multiple non-string-returning functions are
+        detected.
+        """
+        function_calls = self.call_extractor.extract(value)
+        non_string_functions = [
+            func
+            for func in function_calls
+            if is_native_return(self.env.globals.get(func))
+        ]
+
+        if len(non_string_functions) > 1:
+            raise ParserError(
+                f"Template error for key '{key}': Multiple non-string-returning"
+                f"functions cannot be used together in the same template. "
+                f"Found: {', '.join(non_string_functions)}"
+            )
+
+        template = self._template_cache[value] = self.env.from_string(value)
+        return template
+
     def parse_list(self, lst, key):
         """Parse a list of values."""
         return [self.parse_value(item, f"{key}[{i}]") for i, item in enumerate(lst)]
 
 
-def register_global_function(env=_default_env, name=None):
+def _invalidate_env_caches(env):
+    """
+    Drop an environment's call-extraction and compiled-template caches.
+
+    Registering a function or filter changes what extraction should find, and
+    the multiple-native-function validation only runs on a compile-cache miss;
+    entries recorded before the registration must not keep bypassing it.
+    """
+    cache = _env_call_caches.get(env)
+    if cache is not None:
+        cache.clear()
+    cache = _env_template_caches.get(env)
+    if cache is not None:
+        cache.clear()
+
+
+def register_global_function(env=None, name=None):
     """
     Decorator to register a global function in the Jinja environment.
+    Defaults to the shared NativeEnvironment when no environment is given.
     """
 
     def decorator(func):
         _name = name if name is not None else func.__name__
-        env.globals[_name] = func
+        _env = env if env is not None else _get_default_env()
+        _env.globals[_name] = func
+        _invalidate_env_caches(_env)
         return func
 
     return decorator
 
 
-def register_filter(env=_default_env, name=None):
+def register_filter(env=None, name=None):
     """
     Decorator to register a filter in the Jinja environment.
+    Defaults to the shared NativeEnvironment when no environment is given.
     """
 
     def decorator(func):
         _name = name if name is not None else func.__name__
-        env.filters[_name] = func
+        _env = env if env is not None else _get_default_env()
+        _env.filters[_name] = func
+        _invalidate_env_caches(_env)
         return func
 
     return decorator
@@ -232,15 +585,27 @@ def register_cfg_parser(extension):
     return decorator
 
 
+# Functions marked as returning native objects. A set keyed on function
+# identity makes the per-template check a hash lookup instead of a getattr.
+_native_funcs = set()
+
+
 def returns_native_non_string(func):
     """
     Decorator to mark a function as returning a native (non-string) object.
     """
+    # The attribute is kept for introspection; the set is what the parser
+    # consults on the hot path.
     func.returns_native = True
+    _native_funcs.add(func)
     return func
 
 
-@register_global_function()
+def is_native_return(func):
+    """Return True if func was marked with returns_native_non_string."""
+    return func in _native_funcs
+
+
 @returns_native_non_string
 def import_py_obj(path):
     """
@@ -257,7 +622,6 @@ def import_py_obj(path):
         raise ValueError(f"Unable to import '{path}': {e}")
 
 
-@register_global_function()
 def env_var(var_name, default=""):
     """
     Retrieve an environment variable, returning a default value if not found.
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from cfgengine.config_loader import ConfigLoader
@@ -13,20 +14,25 @@ class MockParser(CfgParser):
 
 
 class TestConfigLoader(unittest.TestCase):
-    def setUp(self):
-        """Setup mock files and environment variables for testing."""
-        self.mock_file_name = "mock_config.mock"
-        self.mock_file_path = f"./{self.mock_file_name}"
-        self.env_var_name = ConfigLoader.DEFAULT_CONFIG_FILE_VAR
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared mock configuration file once in a temp directory."""
+        cls.env_var_name = ConfigLoader.DEFAULT_CONFIG_FILE_VAR
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.mock_file_name = "mock_config.mock"
+        cls.mock_file_path = os.path.join(cls.tmp_dir.name, cls.mock_file_name)
 
         # Create a mock configuration file
-        with open(self.mock_file_path, "w") as mock_file:
+        with open(cls.mock_file_path, "w") as mock_file:
             mock_file.write("{}")
 
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory and the mock file with it."""
+        cls.tmp_dir.cleanup()
+
     def tearDown(self):
-        """Cleanup after each test."""
-        if os.path.exists(self.mock_file_path):
-            os.remove(self.mock_file_path)
+        """Cleanup environment variables after each test."""
         if self.env_var_name in os.environ:
             del os.environ[self.env_var_name]
 
@@ -76,6 +82,35 @@ class TestConfigLoader(unittest.TestCase):
 
         os.remove(unregistered_file)
 
+    def test_load_config_cache_returns_fresh_copy(self):
+        """Test that cache hits hand each caller its own top-level copy."""
+        ParserRegistry.register_parser("mock", MockParser)
+        first = ConfigLoader.load_config(config_dir_or_path=self.mock_file_path)
+        first["mock_key"] = "changed"
+        second = ConfigLoader.load_config(config_dir_or_path=self.mock_file_path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second["mock_key"], "mock_value")
+
+    def test_clear_config_cache(self):
+        """Test dropping cached parses for one path and for all paths."""
+        ParserRegistry.register_parser("mock", MockParser)
+        config = ConfigLoader.load_config(config_dir_or_path=self.mock_file_path)
+        ConfigLoader.clear_config_cache(self.mock_file_path)
+        reloaded = ConfigLoader.load_config(config_dir_or_path=self.mock_file_path)
+        self.assertEqual(reloaded, config)
+        ConfigLoader.clear_config_cache()
+
+    def test_invalidate_stat_cache(self):
+        """Test that invalidation makes check_file_path see a new file."""
+        late_file = os.path.join(self.tmp_dir.name, "appears_later.mock")
+        self.assertFalse(ConfigLoader.check_file_path(late_file))
+        with open(late_file, "w") as f:
+            f.write("{}")
+        ConfigLoader.invalidate_stat_cache(late_file)
+        self.assertTrue(ConfigLoader.check_file_path(late_file))
+        os.remove(late_file)
+        ConfigLoader.invalidate_stat_cache()
+
     def test_get_config_file_path_specific_file(self):
         """Test resolving a user-specified full file path."""
         result = ConfigLoader.get_config_file_path(self.mock_file_path)
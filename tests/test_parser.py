@@ -1,4 +1,6 @@
+import configparser
 import os
+import sys
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -9,7 +11,13 @@ from cfgengine import (
     ParserRegistry,
     returns_native_non_string,
 )
-from cfgengine.parser import FunctionCallExtractor, Parser
+from cfgengine.default_parser import orjson
+from cfgengine.parser import (
+    FunctionCallExtractor,
+    Parser,
+    ParserError,
+    register_global_function,
+)
 
 
 class TestDotDict(unittest.TestCase):
@@ -33,6 +41,38 @@ class TestDotDict(unittest.TestCase):
         with self.assertRaises(AttributeError):
             _ = d.nonexistent_key
 
+    def test_mirror_coherence_across_mutators(self):
+        d = DotDict({"a": 1})
+        d["a"] = 2
+        self.assertEqual(d.a, 2)
+        d |= {"a": 3, "b": 4}
+        self.assertEqual(d.a, 3)
+        self.assertEqual(d.b, 4)
+        d.update(b=5)
+        self.assertEqual(d.b, 5)
+        d.setdefault("c", 6)
+        self.assertEqual(d.c, 6)
+        d.pop("c")
+        with self.assertRaises(AttributeError):
+            _ = d.c
+        key, _ = d.popitem()
+        with self.assertRaises(AttributeError):
+            getattr(d, key)
+        del d["a"]
+        with self.assertRaises(AttributeError):
+            _ = d.a
+        d["x"] = 1
+        d.clear()
+        with self.assertRaises(AttributeError):
+            _ = d.x
+
+    def test_dict_subclass_values_wrapped(self):
+        from collections import OrderedDict
+
+        d = DotDict({"a": OrderedDict({"b": 1}), "lst": [OrderedDict({"c": 2})]})
+        self.assertEqual(d.a.b, 1)
+        self.assertEqual(d.lst[0].c, 2)
+
 
 class TestParserRegistry(unittest.TestCase):
     def test_register_and_get_parser(self):
@@ -67,6 +107,31 @@ class TestJSONParser(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             parser.load()
 
+    @patch("builtins.open", new_callable=mock_open, read_data='{"a": 1, "b": 2}')
+    def test_load_with_schema(self, mock_file):
+        parser = JSONParser("dummy_path.json", schema=["a"])
+        self.assertEqual(parser.load(), {"a": 1})
+
+    @patch("builtins.open", new_callable=mock_open, read_data='{"a": 1, "b": 2}')
+    def test_load_without_schema_keeps_all_keys(self, mock_file):
+        parser = JSONParser("dummy_path.json")
+        self.assertEqual(parser.load(), {"a": 1, "b": 2})
+
+    def test_loads_str(self):
+        self.assertEqual(JSONParser.loads('{"key": "value"}'), {"key": "value"})
+
+    def test_loads_bytes(self):
+        self.assertEqual(JSONParser.loads(b'{"key": "value"}'), {"key": "value"})
+
+    def test_loads_invalid(self):
+        with self.assertRaises(ValueError):
+            JSONParser.loads("invalid json")
+
+    @unittest.skipIf(orjson is not None, "orjson does not intern object keys")
+    def test_loads_interns_keys(self):
+        data = JSONParser.loads('{"section_name": 1}')
+        self.assertIs(next(iter(data)), sys.intern("section_name"))
+
 
 class TestINIParser(unittest.TestCase):
     @patch("builtins.open", new_callable=mock_open, read_data="[section]\nkey=value")
@@ -81,6 +146,14 @@ class TestINIParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             parser.load()
 
+    def test_loads_valid_ini(self):
+        config = INIParser.loads("[section]\nkey=value")
+        self.assertEqual(config, {"section": {"key": "value"}})
+
+    def test_loads_invalid_ini(self):
+        with self.assertRaises(configparser.Error):
+            INIParser.loads("invalid ini")
+
 
 class TestFunctionCallExtractor(unittest.TestCase):
     def test_extract_function_calls(self):
@@ -114,6 +187,26 @@ class TestParser(unittest.TestCase):
         result = self.parser.parse_config(config)
         self.assertEqual(result["key1"], "rendered_value")
 
+    def test_parse_config_dict_subclass(self):
+        from collections import OrderedDict
+
+        config = OrderedDict({"key": OrderedDict({"subkey": "{{ value }}"})})
+        result = self.parser.parse_config(config)
+        self.assertEqual(result["key"]["subkey"], "rendered_value")
+
+    def test_native_env_coerces_plain_strings(self):
+        from jinja2.nativetypes import NativeEnvironment
+
+        parser = Parser(NativeEnvironment())
+        self.assertEqual(parser.parse_string("8080", "key"), 8080)
+        self.assertEqual(parser.parse_string("3.14", "key"), 3.14)
+        self.assertIsNone(parser.parse_string("None", "key"))
+        self.assertEqual(parser.parse_string("[1, 2]", "key"), [1, 2])
+        self.assertEqual(parser.parse_string("hello", "key"), "hello")
+
+    def test_non_native_env_keeps_plain_strings(self):
+        self.assertEqual(self.parser.parse_string("8080", "key"), "8080")
+
 
 class TestGlobalFunctions(unittest.TestCase):
     def test_returns_native(self):
@@ -123,6 +216,31 @@ class TestGlobalFunctions(unittest.TestCase):
 
         self.assertTrue(getattr(dummy_func, "returns_native", False))
 
+    def test_registration_invalidates_extraction_caches(self):
+        from jinja2.nativetypes import NativeEnvironment
+
+        env = NativeEnvironment()
+
+        @register_global_function(env)
+        @returns_native_non_string
+        def native_a():
+            return []
+
+        # Extract and compile while native_b is still unknown; the result
+        # lands in the per-env caches.
+        template = "{{ native_a() }} {{ native_b() }}"
+        Parser(env)._compile_template(template, "key")
+
+        @register_global_function(env)
+        @returns_native_non_string
+        def native_b():
+            return []
+
+        # Registration must drop the stale entries so the multiple-native-
+        # function guard sees both calls on the next parse.
+        with self.assertRaises(ParserError):
+            Parser(env).parse_string(template, "key")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from cfgengine.config_loader import ConfigLoader
@@ -24,22 +25,25 @@ class TestParserRegistry(unittest.TestCase):
 
 
 class TestConfigLoader(unittest.TestCase):
-    def setUp(self):
-        """Setup mock paths and environment variables."""
-        self.default_current_path = ConfigLoader.DEFAULT_CURRENT_PATH
-        self.default_home_path = ConfigLoader.DEFAULT_HOME_PATH
-        self.default_env_var = ConfigLoader.DEFAULT_CONFIG_FILE_VAR
-        self.mock_file_name = "config.mock"
-        self.mock_file_path = f"./{self.mock_file_name}"
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared mock file once in a temporary directory."""
+        cls.default_env_var = ConfigLoader.DEFAULT_CONFIG_FILE_VAR
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.mock_file_name = "config.mock"
+        cls.mock_file_path = os.path.join(cls.tmp_dir.name, cls.mock_file_name)
 
         # Create a mock file
-        with open(self.mock_file_name, "w") as mock_file:
+        with open(cls.mock_file_path, "w") as mock_file:
             mock_file.write("{}")
 
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory and the mock file with it."""
+        cls.tmp_dir.cleanup()
+
     def tearDown(self):
-        """Cleanup mock files and environment variables."""
-        if os.path.exists(self.mock_file_name):
-            os.remove(self.mock_file_name)
+        """Cleanup environment variables."""
         if self.default_env_var in os.environ:
             del os.environ[self.default_env_var]
 